@@ -9,17 +9,153 @@ Handles login wall with manual intervention
 
 import os
 import time
+import asyncio
+import itertools
+import threading
+from multiprocessing.pool import ThreadPool
 import pandas as pd
+from urllib.parse import urljoin
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from webdriver_manager.chrome import ChromeDriverManager
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
 from selenium.common.exceptions import NoSuchElementException, ElementClickInterceptedException
+from selenium.common.exceptions import ElementNotInteractableException, StaleElementReferenceException
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException
 
+# Expected failures when a page element is missing, covered, or re-rendered.
+# Caught explicitly so KeyboardInterrupt still stops a long run.
+ELEMENT_ERRORS = (
+    NoSuchElementException,
+    ElementClickInterceptedException,
+    ElementNotInteractableException,
+    TimeoutException,
+    StaleElementReferenceException,
+)
+
+# Current and older job-card markup in one union, so a miss costs no second query
+JOB_CARD_SELECTOR = "li[data-test='jobListing'], li.JobsList_jobListItem__wjThv, div[data-test='job-listing']"
+MODAL_CLOSE_SELECTOR = (
+    "button[data-test='close-modal'], button[aria-label='Close'], button.CloseButton, "
+    "svg[data-test='close-icon'], span[aria-label='Close']"
+)
+# Cards carry their posting id; the detail pane's title heading embeds the same id
+JOB_ID_ATTRIBUTE = "data-jobid"
+DETAIL_TITLE_BY_JOB_ID = "h1[id='jd-job-title-{job_id}']"
+DETAIL_PANE_SELECTOR = "div[data-test='job-details-panel'], div[class*='JobDetails_jobDetails']"
+
+# --- Selectors, passed as plain CSS lists to the in-browser extractor ---
+# Output column -> CSS selectors tried in order inside the detail pane
+DETAIL_FIELD_SELECTORS = {
+    "Job Title": ["h1.heading_Level1__w42c9", "h1[id*='jd-job-title-']", "div[data-test='jobTitle']"],
+    "Company": ["div.EmployerProfile_employerNameHeading__bXBYr", "div[data-test='employerName']"],
+    "Location": ["div[data-test='location']"],
+    "Salary Estimate": ["div[data-test='detailSalary']", "span[data-test='detailSalary']"],
+    "Rating": ["span.rating-single-star_RatingText__5fdjN", "span[data-test='detailRating']"],
+    "Description": ["div.JobDetails_jobDescription__uW_fK", "div[data-test='jobDescriptionText']"],
+}
+
+# Output column -> label text in the company overview section
+DETAIL_FIELD_LABELS = {
+    "Headquarters": "Headquarters",
+    "Size": "Size",
+    "Founded": "Founded",
+    "Ownership": "Type",
+    "Industry": "Industry",
+    "Sector": "Sector",
+    "Revenue": "Revenue",
+    "Competitors": "Competitors",
+}
+
+# Output columns, in CSV order
+JOB_COLUMNS = list(DETAIL_FIELD_SELECTORS) + list(DETAIL_FIELD_LABELS)
+
+# The subset of fields shown on the job card itself in the results list
+CARD_FIELD_SELECTORS = {
+    "Job Title": ["a[data-test='job-title']", "a[class*='JobCard_jobTitle']"],
+    "Company": [
+        "span[class*='EmployerProfile_compactEmployerName']",
+        "div[class*='EmployerProfile_employerName']",
+    ],
+    "Location": ["div[data-test='emp-location']"],
+    "Salary Estimate": ["div[data-test='detailSalary']"],
+    "Rating": ["span[class*='rating-single-star_RatingText']", "span[data-test='rating']"],
+}
+
+# lxml equivalents for the HTTP-only list path, which never touches the browser DOM
+JOB_CARD_XPATH = "//li[@data-test='jobListing'] | //li[contains(@class, 'JobsList_jobListItem')] | //div[@data-test='job-listing']"
+CARD_FIELD_XPATHS = {
+    "Job Title": [".//a[@data-test='job-title']", ".//a[contains(@class, 'JobCard_jobTitle')]"],
+    "Company": [
+        ".//span[contains(@class, 'EmployerProfile_compactEmployerName')]",
+        ".//div[contains(@class, 'EmployerProfile_employerName')]",
+    ],
+    "Location": [".//div[@data-test='emp-location']"],
+    "Salary Estimate": [".//div[@data-test='detailSalary']"],
+    "Rating": [".//span[contains(@class, 'rating-single-star_RatingText')]", ".//span[@data-test='rating']"],
+}
+SEE_MORE_JOBS_XPATH = "//a[contains(., 'See more jobs')]/@href"
+
+# Extractor kind -> (column -> CSS selectors, column -> overview label)
+EXTRACTOR_FIELDS = {
+    "detail": (DETAIL_FIELD_SELECTORS, DETAIL_FIELD_LABELS),
+    "card": (CARD_FIELD_SELECTORS, {}),
+}
+
+# Column -> max characters kept; longer values are cut and get a "..." suffix
+FIELD_MAX_CHARS = {"Description": 500}
+
+# Defines window.__extractJob(root, kind), which pulls every field for `kind`
+# ("detail" pane or list "card") out of root inside the browser, so a card costs
+# a single WebDriver round-trip. For each column the first selector with
+# non-empty text wins, "-1" when nothing matches. Company-overview labels (Headquarters,
+# Size, ...) are collected in one DOM walk rather than one XPath scan per
+# label. Fields in maxChars are cut in the browser, so the full text never
+# crosses the wire or lands in Python memory. Installed once per page with
+# execute_script(INSTALL_EXTRACTOR_JS, EXTRACTOR_FIELDS, FIELD_MAX_CHARS).
+INSTALL_EXTRACTOR_JS = """
+const [extractorFields, maxChars] = arguments;
+window.__extractJob = function (root, kind) {
+    const [fieldSelectors, fieldLabels] = extractorFields[kind];
+    const LABELS = new Set(Object.values(fieldLabels));
+    const first = (selectors) => {
+        for (const sel of selectors) {
+            const el = root.querySelector(sel);
+            const text = el ? el.innerText.trim() : '';
+            if (text) return text;
+        }
+        return '-1';
+    };
+    const labels = {};
+    if (LABELS.size) {
+        root.querySelectorAll('div').forEach(d => {
+            const span = d.querySelector(':scope > span');
+            if (span && LABELS.has(span.textContent) && !(span.textContent in labels)) {
+                const value = d.querySelector(':scope > div');
+                labels[span.textContent] = value ? value.innerText.trim() : '';
+            }
+        });
+    }
+    const job = {};
+    for (const [name, selectors] of Object.entries(fieldSelectors)) job[name] = first(selectors);
+    for (const [name, label] of Object.entries(fieldLabels)) job[name] = labels[label] || '-1';
+    for (const [name, limit] of Object.entries(maxChars)) {
+        if (!(name in job)) continue;
+        // Count code points like Python's len(), so emoji aren't split mid surrogate pair
+        const chars = Array.from(job[name]);
+        if (chars.length > limit) job[name] = chars.slice(0, limit).join('') + '...';
+    }
+    return job;
+};
+"""
+
+# Per-card call: only the element reference goes over the wire, and the browser
+# reuses the already-compiled function. null means the page has not got it yet.
+EXTRACT_JOB_JS = "return window.__extractJob ? window.__extractJob(arguments[0], arguments[1]) : null;"
+
 def wait_for_user_ready(driver, timeout=180):
     """Wait for user to manually handle login and indicate they're ready."""
     print("\n" + "="*70)
@@ -34,57 +170,135 @@ def wait_for_user_ready(driver, timeout=180):
     print("\n✅ Continuing with scraping...\n")
     time.sleep(2)
 
-def safe_find(base_element, selectors_list, default="-1"):
-    """Try multiple selectors within a base element and return first match."""
-    if isinstance(selectors_list, str):
-        selectors_list = [selectors_list]
+def extract_job(driver, root, kind="detail"):
+    """Return root's fields as a dict (kind is "detail" or "card"), installing the extractor on a fresh page."""
+    job_data = driver.execute_script(EXTRACT_JOB_JS, root, kind)
+    if job_data is None:
+        driver.execute_script(INSTALL_EXTRACTOR_JS, EXTRACTOR_FIELDS, FIELD_MAX_CHARS)
+        job_data = driver.execute_script(EXTRACT_JOB_JS, root, kind)
+    return job_data
+
+def open_detail_pane(driver, card, job_id=None):
+    """Click a job card and return the detail pane once it shows that card's job.
+
+    With a job_id the pane's title heading is matched by id, so a preselected
+    card or two postings sharing a title resolve as soon as the pane is ready.
+    Without one it only waits for the pane to exist. Raises TimeoutException
+    if the pane doesn't show up in time.
+    """
+    # Instant scroll: layout settles synchronously, no animation to wait out
+    driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", card)
+    try:
+        card.click()
+    except ELEMENT_ERRORS:
+        close_any_modal(driver) # A popup usually intercepts the click
+        driver.execute_script("arguments[0].click();", card)
     
-    for selector in selectors_list:
-        try:
-            if selector.startswith(("//", ".//")): # Check if it's an XPath
-                element = base_element.find_element(By.XPATH, selector)
-            else:
-                element = base_element.find_element(By.CSS_SELECTOR, selector)
-            text = element.text.strip()
-            if text:
-                return text
-        except:
-            continue
-    return default
+    if job_id:
+        WebDriverWait(driver, 5, poll_frequency=0.1).until(
+            EC.presence_of_element_located((By.CSS_SELECTOR, DETAIL_TITLE_BY_JOB_ID.format(job_id=job_id)))
+        )
+
+    return WebDriverWait(driver, 8).until(
+        EC.presence_of_element_located((By.CSS_SELECTOR, DETAIL_PANE_SELECTOR))
+    )
+
+def wait_for_new_cards(driver, prev_count, timeout=8):
+    """Poll until more than prev_count job cards are on the page. Returns False on timeout."""
+    try:
+        WebDriverWait(driver, timeout, poll_frequency=0.1).until(
+            lambda d: len(d.find_elements(By.CSS_SELECTOR, JOB_CARD_SELECTOR)) > prev_count
+        )
+        return True
+    except TimeoutException:
+        return False
 
 def close_any_modal(driver):
     """Try to find and close any modal popups."""
     try:
-        close_selectors = [
-            "button[data-test='close-modal']",
-            "button[aria-label='Close']",
-            "button.CloseButton",
-            "svg[data-test='close-icon']",
-            "span[aria-label='Close']" # A new one I've seen
-        ]
-        for selector in close_selectors:
+        # All known close buttons in one query rather than one round-trip each
+        for close_btn in driver.find_elements(By.CSS_SELECTOR, MODAL_CLOSE_SELECTOR):
             try:
-                close_btn = driver.find_element(By.CSS_SELECTOR, selector)
                 close_btn.click()
                 time.sleep(1) # Give it a second to close
                 return # Stop after closing one
-            except:
-                pass # Selector not found, try next
+            except ELEMENT_ERRORS:
+                pass # Not clickable, try next
     except Exception as e:
         pass # No modal found or error, just continue
 
-def get_jobs(keyword: str, num_jobs: int, headless: bool = False, verbose: bool = True):
-    """Scrape Glassdoor job data for a given keyword and location."""
+USER_AGENT = "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
 
-    if headless:
-        print("⚠️  Warning: Headless mode disabled for Glassdoor (login required)")
-        headless = False
+BLOCKED_URL_PATTERNS = [
+    "*.jpg", "*.jpeg", "*.png", "*.gif", "*.webp", "*.svg",
+    "*.woff", "*.woff2", "*.ttf", "*.css",
+    "*/analytics/*", "*doubleclick*", "*googletagmanager*", "*google-analytics*",
+]
+
+OUTPUT_CSV = "glassdoor_jobs.csv"
+# Rows are checkpointed here page by page; OUTPUT_CSV is only written once a
+# run has returned jobs, so a failed or interrupted run never clobbers it.
+CHECKPOINT_CSV = "glassdoor_jobs.partial.csv"
+_csv_lock = threading.Lock()
+_checkpoint_started = threading.Event()
+
+def new_job_columns():
+    """Return empty per-column lists; jobs are accumulated column-wise, not as row dicts."""
+    return {name: [] for name in JOB_COLUMNS}
+
+def append_jobs_csv(columns, start=0, path=CHECKPOINT_CSV):
+    """Append rows [start:] of the job columns to the checkpoint CSV.
+
+    The first write of a get_jobs run replaces any previous checkpoint and
+    writes the header; later writes append.
+    """
+    if len(columns["Job Title"]) <= start:
+        return
+    with _csv_lock:
+        first_write = not _checkpoint_started.is_set()
+        pd.DataFrame({name: col[start:] for name, col in columns.items()}).to_csv(
+            path, mode='w' if first_write else 'a', header=first_write, index=False
+        )
+        _checkpoint_started.set()
+
+# One Chrome per worker thread. Drivers stay open between get_jobs calls so each
+# worker keeps its logged-in profile instead of relaunching the browser.
+_drivers = {}
+_drivers_lock = threading.Lock()
+_get_jobs_lock = threading.Lock()
+_login_lock = threading.Lock()
+_thread_state = threading.local()
+
+DRIVER_PATH_CACHE = os.path.join(os.path.expanduser("~"), ".cache", "glassdoor_scraper", "driver_path")
+
+def chromedriver_path(refresh: bool = False):
+    """Return the chromedriver binary path, resolving it over the network only when not cached."""
+    if not refresh:
+        try:
+            with open(DRIVER_PATH_CACHE) as f:
+                path = f.read().strip()
+            if os.path.isfile(path) and os.access(path, os.X_OK):
+                return path
+        except OSError:
+            pass # No cache yet
+
+    path = ChromeDriverManager().install()
+    try:
+        os.makedirs(os.path.dirname(DRIVER_PATH_CACHE), exist_ok=True)
+        with open(DRIVER_PATH_CACHE, "w") as f:
+            f.write(path)
+    except OSError as e:
+        print(f"Could not cache chromedriver path: {e}")
+    return path
+
+def build_driver(profile_name: str = "chrome_profile", debug_port: int = None):
+    """Start Chrome on its own profile directory, with a remote-debugging port only if asked."""
 
     options = Options()
     
     # Add your persistent profile
     try:        
-        profile_path = os.path.join(os.getcwd(), "chrome_profile")
+        profile_path = os.path.join(os.getcwd(), profile_name)
         options.add_argument(f"--user-data-dir={profile_path}")
     except Exception as e:
         print(f"ERROR: Could not set user-data-dir. Check your path: {e}")
@@ -95,32 +309,234 @@ def get_jobs(keyword: str, num_jobs: int, headless: bool = False, verbose: bool
     options.add_argument("--disable-dev-shm-usage")
     options.add_argument("--disable-gpu")
     options.add_argument("--window-size=1920,1080")
-    options.add_argument("--start-maximized")
     options.add_argument("--disable-blink-features=AutomationControlled")
-    options.add_argument("--remote-debugging-port=9222")
-    options.add_argument("user-agent=Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
+    if debug_port is not None:
+        options.add_argument(f"--remote-debugging-port={debug_port}") # 0 lets Chrome pick a free port
+    options.add_argument(f"user-agent={USER_AGENT}")
     options.add_experimental_option("excludeSwitches", ["enable-automation"])
     options.add_experimental_option('useAutomationExtension', False)
     try:
         options.binary_location = "/usr/bin/chromium-browser"
-    except:
+    except Exception:
         pass
     try:
-        service = Service(ChromeDriverManager().install())
+        service = Service(chromedriver_path())
         driver = webdriver.Chrome(service=service, options=options)
     except Exception as e:
         print(f"Error initializing Chrome: {e}")
-        driver = webdriver.Chrome(options=options)
-    driver.execute_cdp_cmd('Network.setUserAgentOverride', {
-        "userAgent": 'Mozilla/5.Example/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-    })
+        try:
+            # The cached chromedriver may no longer match the installed browser
+            service = Service(chromedriver_path(refresh=True))
+            driver = webdriver.Chrome(service=service, options=options)
+        except Exception:
+            driver = webdriver.Chrome(options=options)
+    driver.execute_cdp_cmd('Network.setUserAgentOverride', {"userAgent": USER_AGENT})
     driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
 
+    # Only text is scraped, so skip images, fonts, stylesheets and trackers.
+    # Keep the HTTP cache on so Glassdoor's JS bundles are reused across pages.
+    driver.execute_cdp_cmd('Network.enable', {})
+    driver.execute_cdp_cmd('Network.setBlockedURLs', {"urls": BLOCKED_URL_PATTERNS})
+    driver.execute_cdp_cmd('Network.setCacheDisabled', {"cacheDisabled": False})
+    return driver
+
+def get_driver():
+    """Return the Chrome driver owned by the calling worker, starting it on first use."""
+    worker_id = getattr(_thread_state, "worker_id", 0)
+    with _drivers_lock:
+        driver = _drivers.get(worker_id)
+    if driver is None:
+        # Worker 0 keeps the original profile so an existing login is reused
+        profile_name = "chrome_profile" if worker_id == 0 else f"chrome_profile_{worker_id}"
+        new_profile = not os.path.isdir(os.path.join(os.getcwd(), profile_name))
+        driver = build_driver(profile_name)
+        if new_profile:
+            # A fresh profile has never logged in; one prompt at a time on the terminal
+            with _login_lock:
+                print(f"\n🔐 Chrome profile '{profile_name}' is new and needs a Glassdoor login.")
+                driver.get("https://www.glassdoor.com/Job/index.htm")
+                wait_for_user_ready(driver)
+        with _drivers_lock:
+            _drivers[worker_id] = driver
+    return driver
+
+def _init_worker(worker_ids):
+    """ThreadPool initializer: give each pool thread its own driver slot."""
+    _thread_state.worker_id = next(worker_ids)
+
+def get_jobs(keyword, num_jobs: int, headless: bool = False, verbose: bool = True, workers: int = 1,
+             detail_fields: bool = True):
+    """Scrape Glassdoor job data for a keyword, or a list of keywords in parallel.
+
+    Each keyword is one shard, scraped by its own Chrome instance when
+    workers > 1. num_jobs is split across shards and the results joined at the end.
+    Calls from different threads run one at a time. Parallel workers use their
+    own chrome_profile_N directories; the first time one is created you are
+    asked to log in to Glassdoor in that browser window, after which the login
+    is kept in the profile.
+    With detail_fields=False only the fields on the job card (title, company,
+    location, salary, rating) are scraped and no card is ever clicked.
+    """
+
+    if headless:
+        print("⚠️  Warning: Headless mode disabled for Glassdoor (login required)")
+
+    keywords = [keyword] if isinstance(keyword, str) else list(keyword)
+    if not keywords:
+        raise ValueError("get_jobs needs at least one keyword")
+    # Split num_jobs exactly; the first num_jobs % len(keywords) shards take one extra.
+    # Shards left with nothing to scrape are dropped rather than opening a browser.
+    base, extra = divmod(num_jobs, len(keywords))
+    shard_args = [(kw, base + (i < extra), verbose, detail_fields) for i, kw in enumerate(keywords)]
+    shard_args = [args for args in shard_args if args[1] > 0]
+
+    # Overlapping calls would drive the same browsers and share one checkpoint file
+    with _get_jobs_lock:
+        # The checkpoint file is replaced on this run's first write, not before
+        _checkpoint_started.clear()
+
+        if workers > 1 and len(shard_args) > 1:
+            n_workers = min(workers, len(shard_args))
+            with ThreadPool(n_workers, initializer=_init_worker, initargs=(itertools.count(1),)) as pool:
+                shards = pool.starmap(_scrape_keyword, shard_args)
+        else:
+            shards = [_scrape_keyword(*args) for args in shard_args]
+
+    if shards:
+        df = pd.concat([pd.DataFrame(jobs) for jobs in shards], ignore_index=True)
+    else:
+        df = pd.DataFrame(columns=JOB_COLUMNS) # num_jobs was 0
+
+    print(f"\n{'='*70}")
+    print(f"✅ Scraping complete! Collected {len(df)} jobs.")
+    print(f"{'='*70}\n")
+    
+    # driver.quit() # Still commented out as in your code
+    return df
+
+async def get_jobs_async(keyword, num_jobs: int, headless: bool = False, verbose: bool = True, workers: int = 1,
+                         detail_fields: bool = True):
+    """Awaitable get_jobs: the blocking Selenium waits run off the event loop's thread.
+
+    Lets a running loop (e.g. a Jupyter notebook) keep working while the
+    scrape is in progress. Overlapping calls queue behind each other rather
+    than run concurrently; pass a keyword list with workers > 1 to parallelise.
+    """
+    return await asyncio.to_thread(get_jobs, keyword, num_jobs, headless, verbose, workers, detail_fields)
+
+def _scrape_list_http(driver, search_url: str, jobs, checkpoint, num_jobs: int, verbose: bool = True):
+    """Scrape card-level fields from server-rendered list pages with requests + lxml.
+
+    Reuses the browser profile's cookies and user agent so the logged-in
+    session carries over, without loading any page in the browser. Follows
+    'See more jobs' links and appends to jobs in place. Returns None when done,
+    or the list URL it could not scrape (fetch failed, no cards in the HTML)
+    so the caller can resume from there in the browser. Raises ImportError if
+    requests or lxml is missing.
+    """
+    # Only this path needs them, so the default Selenium path doesn't depend on them
+    import requests
+    import lxml.html
+
+    session = requests.Session()
+    session.headers["User-Agent"] = USER_AGENT
+    # CDP returns the profile's stored cookies for every domain; driver.get_cookies()
+    # would need a Glassdoor page loaded first
+    for cookie in driver.execute_cdp_cmd('Network.getAllCookies', {})["cookies"]:
+        if "glassdoor" in cookie["domain"]:
+            session.cookies.set(cookie["name"], cookie["value"], domain=cookie["domain"])
+
+    n_jobs = len(jobs["Job Title"])
+    url = search_url
+    max_pages = 10
+    for page_num in range(1, max_pages + 1):
+        if not url or n_jobs >= num_jobs:
+            break
+        try:
+            response = session.get(url, timeout=15)
+            response.raise_for_status()
+        except requests.RequestException as e:
+            if verbose:
+                print(f"   ⚠️  HTTP fetch failed: {str(e)[:80]}")
+            break
+        tree = lxml.html.fromstring(response.text)
+
+        cards = tree.xpath(JOB_CARD_XPATH)
+        if verbose:
+            print(f"\n📄 [HTTP] Page {page_num}: {len(cards)} cards in HTML")
+        if not cards:
+            break
+
+        for card in cards[:num_jobs - n_jobs]:
+            for name in JOB_COLUMNS:
+                value = "-1"
+                for xpath in CARD_FIELD_XPATHS.get(name, ()):
+                    found = card.xpath(xpath)
+                    text = " ".join(found[0].text_content().split()) if found else ""
+                    if text:
+                        value = text
+                        break
+                jobs[name].append(value)
+            n_jobs += 1
+        flush_checkpoint(jobs, checkpoint)
+        if verbose:
+            print(f"   ✓ [{n_jobs}/{num_jobs}] collected")
+
+        next_links = tree.xpath(SEE_MORE_JOBS_XPATH)
+        url = urljoin(url, next_links[0]) if next_links else None
+    return url if n_jobs < num_jobs else None
+
+def flush_checkpoint(jobs, checkpoint):
+    """Append rows of jobs not yet in the checkpoint CSV; checkpoint["written"] counts those already saved."""
+    n_jobs = min(len(col) for col in jobs.values())
+    for col in jobs.values():
+        del col[n_jobs:] # Drop a row interrupted halfway through being appended
+    start = checkpoint["written"]
+    # Marked before writing, so a Ctrl-C during the write can't flush the same rows twice
+    checkpoint["written"] = n_jobs
+    append_jobs_csv(jobs, start=start)
+
+def _scrape_keyword(keyword: str, num_jobs: int, verbose: bool = True, detail_fields: bool = True):
+    """Scrape up to num_jobs postings for one keyword on this worker's driver."""
+
+    driver = get_driver()
+
     search_url = (
         f'https://www.glassdoor.com/Job/jobs.htm?sc.keyword={keyword}'
         f"&locT=&locId=jobType="
     )
-    
+
+    jobs = new_job_columns()
+    checkpoint = {"written": 0}
+    try:
+        resume_url = search_url
+        if not detail_fields:
+            # Card fields only: the browser is just the source of session cookies
+            try:
+                resume_url = _scrape_list_http(driver, search_url, jobs, checkpoint, num_jobs, verbose)
+            except ImportError as e:
+                print(f"   - HTTP fast path unavailable ({e}); using the browser.")
+            if resume_url is None:
+                return jobs
+            if jobs["Job Title"]:
+                print(f"   - HTTP path stopped at {len(jobs['Job Title'])} jobs; continuing in the browser.")
+            else:
+                print("   - No job cards in the page HTML; falling back to the browser.")
+
+        _scrape_browser(driver, resume_url, jobs, checkpoint, num_jobs, verbose, detail_fields)
+    except KeyboardInterrupt:
+        # Only reaches the main thread: with workers > 1, pool shards keep just
+        # their last per-page checkpoint
+        flush_checkpoint(jobs, checkpoint)
+        print(f"\n⏹️  Interrupted. Saved {checkpoint['written']} jobs scraped so far to {CHECKPOINT_CSV}.")
+        raise
+
+    return jobs
+
+def _scrape_browser(driver, search_url: str, jobs, checkpoint, num_jobs: int, verbose: bool = True,
+                    detail_fields: bool = True):
+    """Scrape job cards (and their detail panes) in the browser, appending to jobs in place."""
+
     print(f"🌐 Navigating to: {search_url}\n")
     driver.get(search_url)
 
@@ -130,7 +546,7 @@ def get_jobs(keyword: str, num_jobs: int, headless: bool = False, verbose: bool
     
     close_any_modal(driver) 
 
-    jobs = []
+    n_jobs = len(jobs["Job Title"])
     page_num = 1
     max_pages = 10  # Safety limit for *page loads*, not scrolls
     
@@ -139,22 +555,20 @@ def get_jobs(keyword: str, num_jobs: int, headless: bool = False, verbose: bool
     scraped_card_count = 0
     # --- END OF NEW LOGIC ---
 
-    while len(jobs) < num_jobs and page_num <= max_pages:
+    while n_jobs < num_jobs and page_num <= max_pages:
         if verbose:
             print(f"\n📄 Scanning page {page_num}...")
         
         try:
             WebDriverWait(driver, 10).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "li[data-test='jobListing'], li.JobsList_jobListItem__wjThv, div[data-test='job-listing']"))
+                EC.presence_of_element_located((By.CSS_SELECTOR, JOB_CARD_SELECTOR))
             )
         except TimeoutException:
             print("⚠️  Could not find job listings on this page. Stopping.")
             break
 
         # Get ALL job cards currently on the page
-        all_job_cards = driver.find_elements(By.CSS_SELECTOR, "li[data-test='jobListing']")
-        if not all_job_cards:
-             all_job_cards = driver.find_elements(By.CSS_SELECTOR, "li.JobsList_jobListItem__wjThv, div[data-test='job-listing']")
+        all_job_cards = driver.find_elements(By.CSS_SELECTOR, JOB_CARD_SELECTOR)
 
         # --- START OF MODIFIED LOGIC ---
         # Slice the list to get only the *new* cards
@@ -174,80 +588,64 @@ def get_jobs(keyword: str, num_jobs: int, headless: bool = False, verbose: bool
             
         # Loop over *only the new cards*
         for idx, card in enumerate(new_job_cards):
-            if len(jobs) >= num_jobs:
+            if n_jobs >= num_jobs:
                 break
-            
-            close_any_modal(driver)
 
+            # Card-level fields first, so a failed detail pane still leaves a record
             try:
-                driver.execute_script("arguments[0].scrollIntoView({behavior: 'smooth', block: 'center'});", card)
-                time.sleep(0.4)
-                try:
-                    card.click()
-                except:
-                    driver.execute_script("arguments[0].click();", card)
-                
-                time.sleep(2) 
+                job_data = dict.fromkeys(JOB_COLUMNS, "-1")
+                job_data.update(extract_job(driver, card, kind="card"))
             except Exception as e:
                 if verbose:
-                    print(f"   ⚠️  Could not click card {idx+1} (new card index): {str(e)[:50]}")
+                    print(f"   ⚠️  Could not read card {idx+1} (new card index): {str(e)[:50]}")
                 continue
 
-            try:
-                detail_pane = WebDriverWait(driver, 8).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, "div[data-test='job-details-panel'], div[class*='JobDetails_jobDetails']"))
-                )
-            except TimeoutException:
-                if verbose:
-                    print(f"   ⚠️  Could not find detail pane for card {idx+1}. Skipping.")
-                continue
-            
-            # --- Extract data (all your correct selectors) ---
-            job_title = safe_find(detail_pane, ["h1.heading_Level1__w42c9", "h1[id*='jd-job-title-']", "div[data-test='jobTitle']"])
-            company_name = safe_find(detail_pane, ["div.EmployerProfile_employerNameHeading__bXBYr", "div[data-test='employerName']"])
-            rating = safe_find(detail_pane, ["span.rating-single-star_RatingText__5fdjN", "span[data-test='detailRating']"])
-            location = safe_find(detail_pane, ["div[data-test='location']"])
-            salary_estimate = safe_find(detail_pane, ["div[data-test='detailSalary']", "span[data-test='detailSalary']"])
-            job_description = safe_find(detail_pane, ["div.JobDetails_jobDescription__uW_fK", "div[data-test='jobDescriptionText']"])
-            headquarters = safe_find(detail_pane, [".//div[span[text()='Headquarters']]/div"])
-            size = safe_find(detail_pane, [".//div[span[text()='Size']]/div"])
-            founded = safe_find(detail_pane, [".//div[span[text()='Founded']]/div"])
-            type_of_ownership = safe_find(detail_pane, [".//div[span[text()='Type']]/div"])
-            industry = safe_find(detail_pane, [".//div[span[text()='Industry']]/div"])
-            sector = safe_find(detail_pane, [".//div[span[text()='Sector']]/div"])
-            revenue = safe_find(detail_pane, [".//div[span[text()='Revenue']]/div"])
-            competitors = safe_find(detail_pane, [".//div[span[text()='Competitors']]/div"])
-
-            job_data = {
-                "Job Title": job_title, "Company": company_name, "Location": location,
-                "Salary Estimate": salary_estimate, "Rating": rating,
-                "Description": job_description[:500] + "..." if len(job_description) > 500 else job_description,
-                "Headquarters": headquarters, "Size": size, "Founded": founded,
-                "Ownership": type_of_ownership, "Industry": industry, "Sector": sector,
-                "Revenue": revenue, "Competitors": competitors,
-            }
+            if detail_fields:
+                try:
+                    job_id = card.get_attribute(JOB_ID_ATTRIBUTE)
+                    detail_pane = open_detail_pane(driver, card, job_id)
+                    # --- Extract data: one execute_script round-trip instead of 14 find_element calls ---
+                    detail_data = extract_job(driver, detail_pane)
+                    # open_detail_pane matched the job id; without one, the titles must agree
+                    if job_id or detail_data["Job Title"] == job_data["Job Title"] != "-1":
+                        job_data.update((name, value) for name, value in detail_data.items() if value != "-1")
+                    elif verbose:
+                        print(f"   ⚠️  Detail pane for card {idx+1} shows another job. Keeping card fields only.")
+                except TimeoutException:
+                    if verbose:
+                        print(f"   ⚠️  Could not find detail pane for card {idx+1}. Keeping card fields only.")
+                except Exception as e:
+                    if verbose:
+                        print(f"   ⚠️  Could not click card {idx+1} (new card index): {str(e)[:50]}")
+
+            job_title = job_data["Job Title"]
+            company_name = job_data["Company"]
             
-            jobs.append(job_data)
+            for name in JOB_COLUMNS:
+                jobs[name].append(job_data[name])
+            n_jobs += 1
             if verbose:
-                print(f"   ✓ [{len(jobs)}/{num_jobs}] {job_title[:40]}... @ {company_name[:30]}...")
+                print(f"   ✓ [{n_jobs}/{num_jobs}] {job_title[:40]}... @ {company_name[:30]}...")
 
-        jobs.to_csv("glassdoor_jobs.csv", index=False)
+        # Checkpoint only the rows scraped since the last write
+        flush_checkpoint(jobs, checkpoint)
 
         # --- START: FULLY REVISED NAVIGATION LOGIC ---
-        if len(jobs) < num_jobs:
+        if n_jobs < num_jobs:
             navigated = False
             
             # CASE 1: "Show more jobs" button (Infinite Scroll)
             try:
                 driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
                 time.sleep(2)
-                show_more_btn = driver.find_element(By.CSS_SELECTOR, "button[data-test='load-more']")
+                show_more_btns = driver.find_elements(By.CSS_SELECTOR, "button[data-test='load-more']")
+                show_more_btn = show_more_btns[0] if show_more_btns else None
                 
-                if show_more_btn.is_enabled() and show_more_btn.is_displayed():
+                if show_more_btn and show_more_btn.is_enabled() and show_more_btn.is_displayed():
                     if verbose:
                         print(f"\nPagination: Clicking 'Show more jobs' to load more...")
                     show_more_btn.click()
-                    time.sleep(4)
+                    wait_for_new_cards(driver, len(all_job_cards))
                     
                     # KEY FIX: Update the count of processed cards to the current total
                     scraped_card_count = len(all_job_cards) 
@@ -258,15 +656,20 @@ def get_jobs(keyword: str, num_jobs: int, headless: bool = False, verbose: bool
                     # 'continue' restarts the while loop. It will re-scan and
                     # slice all_job_cards starting from the new count.
                     continue 
-            except:
-                if verbose:
-                    print("   - No 'Show more jobs' button found. Checking for 'Next' button...")
+            except ELEMENT_ERRORS:
+                pass # Button went stale or the click was intercepted
+            if verbose:
+                print("   - No 'Show more jobs' button found. Checking for 'Next' button...")
 
             # CASE 2: "See more jobs" link (New URL)
             if not navigated:
                 try:
-                    more_jobs_link = driver.find_element(By.XPATH, "//a[contains(., 'See more jobs')]")
-                    new_url = more_jobs_link.get_attribute('href')
+                    more_jobs_links = driver.find_elements(By.XPATH, "//a[contains(., 'See more jobs')]")
+                    if not more_jobs_links:
+                        if verbose:
+                            print("\n✓ No 'Show more', 'Next', or 'See more' links/buttons found. Scraping complete.")
+                        break
+                    new_url = more_jobs_links[0].get_attribute('href')
                     
                     if new_url:
                         if verbose:
@@ -276,7 +679,12 @@ def get_jobs(keyword: str, num_jobs: int, headless: bool = False, verbose: bool
                             print("="*40)
                         
                         driver.get(new_url)
-                        time.sleep(5) 
+                        try:
+                            WebDriverWait(driver, 10, poll_frequency=0.1).until(
+                                EC.presence_of_element_located((By.CSS_SELECTOR, DETAIL_PANE_SELECTOR))
+                            )
+                        except TimeoutException:
+                            pass # The listing wait at the top of the loop decides whether to stop
                         close_any_modal(driver) 
                         
                         # KEY FIX: Reset card count for the new page
@@ -287,10 +695,6 @@ def get_jobs(keyword: str, num_jobs: int, headless: bool = False, verbose: bool
                         page_num = 1 # Reset page counter
                         continue 
                     
-                except NoSuchElementException:
-                    if verbose:
-                        print("\n✓ No 'Show more', 'Next', or 'See more' links/buttons found. Scraping complete.")
-                    break 
                 except Exception as e:
                     if verbose:
                         print(f"\nError in final navigation step: {e}")
@@ -303,13 +707,6 @@ def get_jobs(keyword: str, num_jobs: int, headless: bool = False, verbose: bool
         
         # --- END: FULLY REVISED NAVIGATION LOGIC ---
 
-    print(f"\n{'='*70}")
-    print(f"✅ Scraping complete! Collected {len(jobs)} jobs.")
-    print(f"{'='*70}\n")
-    
-    # driver.quit() # Still commented out as in your code
-    return pd.DataFrame(jobs)
-
 if __name__ == "__main__":
     print("\n" + "="*70)
     print("🔍 GLASSDOOR JOB SCRAPER")
@@ -324,8 +721,10 @@ if __name__ == "__main__":
     print(df)
     
     if len(df) > 0:
-        df.to_csv("glassdoor_jobs.csv", index=False)
-        print(f"💾 Saved {len(df)} jobs to glassdoor_jobs.csv")
+        df.to_csv(OUTPUT_CSV, index=False)
+        print(f"💾 Saved {len(df)} jobs to {OUTPUT_CSV}")
+        if os.path.exists(CHECKPOINT_CSV):
+            os.remove(CHECKPOINT_CSV) # Superseded by the full output
         print(f"\nColumns: {list(df.columns)}")
         print(f"\nFirst few jobs:")
         print(df[['Job Title', 'Company', 'Location']].head())